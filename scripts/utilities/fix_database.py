@@ -37,7 +37,7 @@ def main():
         logger.info("\n" + "=" * 80)
         logger.info("Running TRANSFORMATION phase...")
         logger.info("=" * 80)
-        variants_df, genes_df = pipeline.run_transformation(max_rows=None, use_vcfpy=False)
+        variants_df, genes_df = pipeline.run_transformation(max_rows=None, use_cyvcf2=False)
         logger.info(f"✓ Created {len(variants_df)} variants and {len(genes_df)} genes")
 
         # Step 3: Run enrichment (creates drug_annotations.csv and enriches genes.csv)
@@ -2,26 +2,266 @@
 Transform VCF data into structured format
 Parse VCF files and normalize variant information
 """
+import csv
+import functools
 import gzip
+import io
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as pa_ds
+import pyarrow.parquet as pq
 from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
-import vcfpy
+from cyvcf2 import VCF
 
 from ..utils import (
     get_logger,
     log_execution_time,
-    load_config,
-    file_exists
+    load_config
 )
 
+# Optional: Hyperscan compiles the fixed INFO keyset into one SIMD DFA
+# scanned in a single pass per string; the dict parser is the fallback
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional: numba JIT-compiles the byte-level INFO scanner to machine
+# code; the dict parser is the fallback
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = get_logger(__name__)
 
+# Output CSV column order for parsed variants
+VARIANT_FIELDS = [
+    'chromosome',
+    'position',
+    'variant_id',
+    'reference_allele',
+    'alternate_allele',
+    'quality',
+    'filter',
+    'allele_frequency',
+    'allele_count',
+    'total_alleles',
+    'clinical_significance',
+    'disease_name',
+    'gene_symbol',
+    'gene_id',
+    'info_raw',
+    'chrom_code',
+]
+
+# Canonical contig codes: autosomes 1..22 -> 0..21, X -> 22, Y -> 23,
+# M/MT -> 24; 'chr'-prefixed spellings map to the same codes. Filtering
+# and joining on the int8 code column is a branchless SIMD compare,
+# where string equality allocates and compares PyUnicode objects.
+CONTIG_CODES = {str(i): i - 1 for i in range(1, 23)}
+CONTIG_CODES.update({'X': 22, 'Y': 23, 'M': 24, 'MT': 24})
+CONTIG_CODES.update({f'chr{name}': code for name, code in list(CONTIG_CODES.items())})
+
+# Reverse lookup for display: code -> canonical contig name
+CODES_TO_CONTIG = [str(i) for i in range(1, 23)] + ['X', 'Y', 'M']
+
+
+# Raw column layout of the 8 standard VCF columns as read from disk,
+# shared by the chunked, parallel, and byte-range readers
+_RAW_VCF_COLUMNS = ['chromosome', 'position', 'variant_id', 'reference_allele',
+                    'alternate_allele', 'quality', 'filter', 'info_raw']
+# Narrow dtypes: positions fit uint32 (max ~2.5e8), ~25 distinct
+# chromosomes make category an int8-code column, and arrow-backed
+# strings avoid one PyObject per allele - scans and joins move half the bytes
+_RAW_VCF_DTYPES = {'chromosome': 'category', 'position': 'uint32',
+                   'variant_id': 'string', 'quality': 'string',
+                   'reference_allele': 'string[pyarrow]',
+                   'alternate_allele': 'string[pyarrow]'}
+
+# Dtypes for reading a written variants CSV back (streaming Parquet
+# export): every column pinned so the Arrow schema never depends on
+# which values happen to appear in the first chunk - an all-NA text
+# column would otherwise infer as float64 and fail the cast later
+_VARIANT_CSV_DTYPES = {
+    'chromosome': 'string',
+    'position': 'uint32',
+    'variant_id': 'string',
+    'reference_allele': 'string',
+    'alternate_allele': 'string',
+    'quality': 'string',
+    'filter': 'string',
+    'allele_frequency': 'Float64',
+    'allele_count': 'Int64',
+    'total_alleles': 'Int64',
+    'clinical_significance': 'string',
+    'disease_name': 'string',
+    'gene_symbol': 'string',
+    'gene_id': 'string',
+    'info_raw': 'string',
+    'chrom_code': 'int8',
+}
+
+# INFO keys extracted on every record; the Hyperscan database compiles
+# these into a single DFA so one scan finds all of them
+_INFO_SCAN_KEYS = ('AF', 'AC', 'AN', 'CLNSIG', 'CLNDN', 'GENEINFO')
+_info_scan_db = None
+
+# Byte-level representation of the keyset for the numba scanner: one
+# row per key, padded to the longest key, plus the true lengths
+_INFO_KEY_LENS = np.array([len(k) for k in _INFO_SCAN_KEYS], dtype=np.int64)
+_INFO_KEY_BYTES = np.zeros((len(_INFO_SCAN_KEYS), int(_INFO_KEY_LENS.max())),
+                           dtype=np.uint8)
+for _i, _key in enumerate(_INFO_SCAN_KEYS):
+    _INFO_KEY_BYTES[_i, :len(_key)] = np.frombuffer(_key.encode(), dtype=np.uint8)
+del _i, _key
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _scan_info_spans(data, keys, key_lens, out):
+        """Single-pass state machine over INFO bytes
+
+        Walks ';'-separated segments, matches each key against the
+        keyset by length then bytes, and records (value_start,
+        value_end) spans in out (-1 where a key is absent).
+        """
+        n = data.shape[0]
+        n_keys = keys.shape[0]
+        i = 0
+        while i < n:
+            # Scan the key until '=' (61) or end of segment ';' (59)
+            j = i
+            while j < n and data[j] != 61 and data[j] != 59:
+                j += 1
+            if j < n and data[j] == 61:
+                # Value runs to the next ';' or end of buffer
+                k = j + 1
+                while k < n and data[k] != 59:
+                    k += 1
+                key_len = j - i
+                for q in range(n_keys):
+                    if key_lens[q] == key_len:
+                        match = True
+                        for b in range(key_len):
+                            if keys[q, b] != data[i + b]:
+                                match = False
+                                break
+                        if match:
+                            out[q, 0] = j + 1
+                            out[q, 1] = k
+                            break
+                i = k + 1
+            else:
+                # Flag field (no '=') - skip the segment
+                i = j + 1
+        return out
+
+
+def _get_info_scan_db():
+    """Build (once) the Hyperscan database for the standard INFO keys"""
+    global _info_scan_db
+    if _info_scan_db is None:
+        db = hyperscan.Database()
+        expressions = [rf'(?:^|;){key}=([^;]*)'.encode() for key in _INFO_SCAN_KEYS]
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+        )
+        _info_scan_db = db
+    return _info_scan_db
+
+
+@dataclass(frozen=True, slots=True)
+class VariantColumns:
+    """Column-oriented (SoA) view of parsed variants
+
+    Range queries like 'variants in gene X' become pure numpy mask
+    arithmetic over contiguous arrays - (chrom == code) & (pos >= a) &
+    (pos <= b) - with no per-row Python dispatch or cache-line waste.
+    """
+    chromosomes: tuple      # category labels, indexed by chrom codes
+    chrom: np.ndarray       # int16 codes into chromosomes
+    pos: np.ndarray         # uint32 positions
+    ref: np.ndarray         # reference alleles
+    alt: np.ndarray         # alternate alleles
+    info: np.ndarray        # raw INFO strings
+
+    def chrom_code(self, name: str) -> int:
+        """Return the int code for a chromosome name (-1 if absent)"""
+        try:
+            return self.chromosomes.index(name)
+        except ValueError:
+            return -1
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Materialize a DataFrame view for pandas-based consumers"""
+        return pd.DataFrame({
+            'chromosome': pd.Categorical.from_codes(
+                self.chrom, categories=list(self.chromosomes)),
+            'position': self.pos,
+            'reference_allele': self.ref,
+            'alternate_allele': self.alt,
+            'info_raw': self.info,
+        })
+
+
+@functools.lru_cache(maxsize=8)
+def _build_clnsig_maps(items: tuple) -> tuple:
+    """Build the int- and str-keyed CLNSIG lookup dicts once per mapping
+
+    The mapping comes from etl_config.yml, so it can't be a module
+    literal; memoizing on its items means repeated VCFTransformer
+    construction (tests, one-transformer-per-partition pipelines)
+    shares one pair of dicts instead of rebuilding them.
+
+    Args:
+        items: tuple(mapping.items()) from the config
+
+    Returns:
+        Tuple of (int-keyed dict, str-keyed dict)
+    """
+    return ({int(k): v for k, v in items},
+            {str(k): v for k, v in items})
+
+
+# GENEINFO is GENE_SYMBOL:GENE_ID (multiple genes '|'-separated, ids
+# may carry further ':' parts). Mirrors the scalar _extract_gene_info:
+# symbol up to the first ':', id up to the next ':' or ';'
+_GENEINFO_RE = re.compile(r'(?:^|;)GENEINFO=([^:;]*)(?::([^:;]*))?')
+
+
+@functools.lru_cache(maxsize=128)
+def _info_re(key: str) -> re.Pattern:
+    """Compiled regex extracting one INFO key's value, cached per key
+
+    Callers that regex-scan INFO strings (e.g. the vectorized chunk
+    transform) share one compiled pattern per key instead of paying
+    pattern compilation on every call.
+    """
+    return re.compile(rf'(?:^|;){re.escape(key)}=([^;]*)')
+
 
 class VCFTransformer:
     """Transform VCF data into structured format"""
 
+    # No per-instance __dict__ - saves a few hundred bytes per instance
+    # when one transformer is created per partition/worker
+    __slots__ = (
+        'config', 'vcf_file_path', 'vcf_compressed_path', 'variants_csv',
+        'variants_parquet_dir', 'genes_csv', 'chunk_size',
+        'info_fields', 'clnsig_mapping', '_clnsig_mapping_int',
+        '_clnsig_mapping_str',
+    )
+
     def __init__(self, config_path: str = "config/etl_config.yml"):
         """Initialize VCF transformer
 
@@ -32,12 +272,115 @@ class VCFTransformer:
         self.vcf_file_path = self.config['paths']['vcf_extracted']
         self.vcf_compressed_path = self.config['paths']['vcf_file']
         self.variants_csv = self.config['paths']['variants_csv']
+        self.variants_parquet_dir = self.config['paths'].get(
+            'variants_parquet_dir', 'data/processed/variants_parquet')
         self.genes_csv = self.config['paths']['genes_csv']
         self.chunk_size = self.config['processing']['chunk_size']
 
         # VCF parsing configuration
         self.info_fields = self.config['vcf_parser']['extract_info_fields']
         self.clnsig_mapping = self.config['vcf_parser']['clinical_significance_mapping']
+        # Normalize mapping keys once per distinct mapping (module-level
+        # memo) so per-row and vectorized lookups are plain dict probes
+        self._clnsig_mapping_int, self._clnsig_mapping_str = _build_clnsig_maps(
+            tuple(self.clnsig_mapping.items()))
+
+    @property
+    def resolved_input(self) -> str:
+        """Preferred parse input, re-resolved on each access
+
+        Prefers the extracted VCF and falls back to the compressed one.
+        The transformer is often constructed before extraction runs, so
+        this can't be frozen at init - and it stats directly rather than
+        through the memoized stat cache, which would never notice the
+        extracted file appearing or vanishing between parses
+        """
+        if os.path.isfile(self.vcf_file_path):
+            return self.vcf_file_path
+        return self.vcf_compressed_path
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _parse_info_dict(info_str: str) -> dict:
+        """Parse a VCF INFO string into a key -> value dict in one pass
+
+        The single-entry cache makes repeated lookups against the same
+        INFO string (several keys per record) cost one parse instead of
+        one scan per key.
+
+        split + partition stay on CPython's C fast paths, unlike a
+        regex findall over the same string.
+
+        Args:
+            info_str: INFO field string
+
+        Returns:
+            Dict of INFO key -> value; VCF flag fields (present without
+            '=value', e.g. 'DB') map to True
+        """
+        result = {}
+        for kv in info_str.split(';'):
+            key, sep, value = kv.partition('=')
+            if sep:
+                result[key] = value
+            elif key:
+                result[key] = True
+        return result
+
+    def _parse_info_fields_bulk(self, info_str: str) -> dict:
+        """Extract all standard INFO keys from one string in a single scan
+
+        With Hyperscan available, the fixed keyset is matched by one
+        SIMD-accelerated DFA pass over the string; otherwise the
+        dict-based parser supplies the same result.
+
+        Args:
+            info_str: INFO field string
+
+        Returns:
+            Dict mapping each key in _INFO_SCAN_KEYS to its value or None
+        """
+        if hyperscan is None:
+            parsed = self._parse_info_dict(info_str)
+            return {key: parsed.get(key) for key in _INFO_SCAN_KEYS}
+
+        data = info_str.encode()
+        result = dict.fromkeys(_INFO_SCAN_KEYS)
+
+        def on_match(pattern_id, start, end, flags, context):
+            # Hyperscan reports a match per end offset as [^;]* grows;
+            # later (longer) matches overwrite, leaving the full value
+            result[_INFO_SCAN_KEYS[pattern_id]] = data[start:end].partition(b'=')[2].decode()
+
+        _get_info_scan_db().scan(data, match_event_handler=on_match)
+        return result
+
+    def _parse_info_fields_numba(self, info_str: str) -> dict:
+        """Extract all standard INFO keys via the JIT-compiled scanner
+
+        The numba state machine finds every key's value span in one
+        machine-code pass over the bytes; only the hit spans are sliced
+        back into Python strings. Falls back to the dict parser when
+        numba isn't installed.
+
+        Args:
+            info_str: INFO field string
+
+        Returns:
+            Dict mapping each key in _INFO_SCAN_KEYS to its value or None
+        """
+        if njit is None:
+            parsed = self._parse_info_dict(info_str)
+            return {key: parsed.get(key) for key in _INFO_SCAN_KEYS}
+
+        data = np.frombuffer(info_str.encode(), dtype=np.uint8)
+        spans = np.full((len(_INFO_SCAN_KEYS), 2), -1, dtype=np.int64)
+        _scan_info_spans(data, _INFO_KEY_BYTES, _INFO_KEY_LENS, spans)
+
+        return {
+            key: info_str[spans[idx, 0]:spans[idx, 1]] if spans[idx, 0] >= 0 else None
+            for idx, key in enumerate(_INFO_SCAN_KEYS)
+        }
 
     def _parse_info_field(self, info_str: str, field_name: str) -> Optional[str]:
         """Parse specific field from VCF INFO column
@@ -49,9 +392,7 @@ class VCFTransformer:
         Returns:
             Field value or None
         """
-        pattern = f'{field_name}=([^;]+)'
-        match = re.search(pattern, info_str)
-        return match.group(1) if match else None
+        return self._parse_info_dict(info_str).get(field_name)
 
     def _extract_gene_info(self, info_str: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract gene symbol and gene ID from INFO field
@@ -62,17 +403,18 @@ class VCFTransformer:
         Returns:
             Tuple of (gene_symbol, gene_id)
         """
-        gene_info = self._parse_info_field(info_str, 'GENEINFO')
-
-        if gene_info:
-            # Format: GENE_SYMBOL:GENE_ID
-            parts = gene_info.split(':')
-            if len(parts) >= 2:
-                return parts[0], parts[1]
-            elif len(parts) == 1:
-                return parts[0], None
-
-        return None, None
+        # Branchless partition chain - no regex state machine and no
+        # full INFO parse when only GENEINFO is wanted
+        rest = info_str.partition('GENEINFO=')[2]
+        if not rest:
+            return None, None
+
+        # Format: GENE_SYMBOL:GENE_ID (first gene if '|'-separated)
+        gene_field = rest.partition(';')[0]
+        gene_symbol, sep, gene_id = gene_field.partition(':')
+        if not sep:
+            return gene_symbol, None
+        return gene_symbol, gene_id.partition(':')[0]
 
     def _parse_clinical_significance(self, clnsig_str: Optional[str]) -> str:
         """Parse clinical significance value
@@ -87,151 +429,581 @@ class VCFTransformer:
             return "Unknown"
 
         # Handle multiple values
-        if '|' in clnsig_str:
-            clnsig_str = clnsig_str.split('|')[0]
+        head = clnsig_str.partition('|')[0]
+
+        # Numeric codes map through the ClinVar table; textual values
+        # pass through as-is (no exception path on the common case)
+        if head.isdigit():
+            return self._clnsig_mapping_int.get(int(head), "Unknown")
+        return head
+
+    @staticmethod
+    def extract_info_column(variants_df: pd.DataFrame, key: str) -> pd.Series:
+        """Materialize one INFO key from the raw column on demand
+
+        The parser keeps the full INFO string in 'info_raw'; keys that
+        downstream code never asks for are never parsed. Extracted
+        Series are cached in the frame's attrs, so repeated requests
+        for the same key cost one dict lookup.
+
+        Args:
+            variants_df: Parsed variants frame with an 'info_raw' column
+            key: INFO key to extract (e.g. 'CLNREVSTAT')
+
+        Returns:
+            Series of values for the key (NA where absent)
+        """
+        cache = variants_df.attrs.setdefault('_info_cache', {})
+        if key not in cache:
+            cache[key] = variants_df['info_raw'].astype('string').str.extract(
+                _info_re(key), expand=False)
+        return cache[key]
+
+    @staticmethod
+    def normalize_chromosome(series: pd.Series) -> pd.Series:
+        """Strip the 'chr' prefix from a chromosome column
 
-        # Try to convert to integer and map
+        Works on the category labels (~25 values) instead of N row
+        strings, so cost is independent of table length.
+
+        Args:
+            series: Chromosome names ('chr1', '1', 'chrX', ...)
+
+        Returns:
+            Categorical Series with bare chromosome names
+        """
+        cats = series.astype('category')
+        renamed = {c: c[3:] for c in cats.cat.categories
+                   if isinstance(c, str) and c.startswith('chr')}
+        if not renamed:
+            return cats
         try:
-            clnsig_int = int(clnsig_str)
-            return self.clnsig_mapping.get(clnsig_int, "Unknown")
-        except (ValueError, KeyError):
-            # Return as-is if it's already a string description
-            return clnsig_str
+            return cats.cat.rename_categories(renamed)
+        except ValueError:
+            # Mixed input ('chrX' alongside 'X') makes renames collide;
+            # merge the labels instead of relabeling in place
+            return series.astype(str).str.replace(
+                '^chr', '', regex=True).astype('category')
 
-    @log_execution_time
-    def parse_vcf_simple(self, input_path: Optional[str] = None, max_rows: Optional[int] = None) -> pd.DataFrame:
-        """Parse VCF file using simple text parsing with chunked processing (memory-efficient)
+    def map_clinical_significance(self, series: pd.Series) -> pd.Series:
+        """Vectorized CLNSIG normalization for a whole column
+
+        Same semantics as _parse_clinical_significance, but applied to
+        the entire Series in C-level pandas passes instead of one Python
+        call per row - use this when post-processing a parsed DataFrame.
 
         Args:
-            input_path: Path to VCF file
-            max_rows: Maximum number of rows to parse (None for all)
+            series: Series of raw CLNSIG values (may contain nulls)
 
         Returns:
-            DataFrame with parsed variants
+            Series of clinical significance descriptions
         """
-        if input_path is None:
-            # Try extracted file first, then compressed
-            if file_exists(self.vcf_file_path):
-                input_path = self.vcf_file_path
-            else:
-                input_path = self.vcf_compressed_path
+        head = series.astype('string').str.partition('|')[0]
+        # Empty values ('CLNSIG=;') are unknown, like the scalar parser
+        head = head.mask(head == '')
+        is_code = head.str.isdigit().fillna(False)
+        mapped = head.map(self._clnsig_mapping_str)
+        # Numeric codes resolve through the mapping (unknown codes ->
+        # "Unknown"); textual values pass through; nulls -> "Unknown"
+        out = head.where(~is_code, mapped.fillna("Unknown"))
+        return out.fillna("Unknown")
+
+    def _transform_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Turn a raw (CHROM..INFO) chunk into the output variant schema
+
+        All column derivations are vectorized pandas operations - the
+        C regex engine extracts INFO keys across the whole chunk at once.
 
-        logger.info(f"Parsing VCF file: {input_path}")
-        logger.info(f"Using memory-efficient chunked processing (chunk size: {self.chunk_size})")
+        Args:
+            chunk: Raw chunk with the 8 standard VCF columns
 
-        # Process in chunks and write directly to CSV to avoid memory issues
-        is_gzipped = input_path.endswith('.gz')
-        open_func = gzip.open if is_gzipped else open
-        mode = 'rt' if is_gzipped else 'r'
+        Returns:
+            DataFrame with VARIANT_FIELDS columns
+        """
+        info = chunk['info_raw'].astype('string')
+        extract = info.str.extract
+
+        # Both GENEINFO groups come from one extract; unlike a partition
+        # chain this always yields two columns (even on all-NA chunks)
+        # and truncates the id at the next ':' like the scalar helper
+        gene_parts = info.str.extract(_GENEINFO_RE)
+
+        # Empty values ('AF=;') must become NA before the numeric casts,
+        # like the line parser's `float(af) if af else None`
+        af = extract(_info_re('AF'), expand=False)
+        ac = extract(_info_re('AC'), expand=False)
+        an = extract(_info_re('AN'), expand=False)
+
+        # Contig codes via a per-category lookup table - ~25 dict probes
+        # regardless of chunk length (chromosome is never null in VCF)
+        chrom_cat = chunk['chromosome'].astype('category').cat
+        code_lookup = np.array(
+            [CONTIG_CODES.get(str(c), -1) for c in chrom_cat.categories],
+            dtype=np.int8)
+        chrom_codes = code_lookup[chrom_cat.codes.to_numpy()]
+
+        return pd.DataFrame({
+            'chromosome': chunk['chromosome'],
+            'position': chunk['position'],
+            'variant_id': chunk['variant_id'].mask(chunk['variant_id'] == '.'),
+            'reference_allele': chunk['reference_allele'],
+            'alternate_allele': chunk['alternate_allele'],
+            'quality': chunk['quality'].mask(chunk['quality'] == '.'),
+            'filter': chunk['filter'],
+            'allele_frequency': af.mask(af == '').astype('Float64'),
+            'allele_count': ac.mask(ac == '').astype('Int64'),
+            'total_alleles': an.mask(an == '').astype('Int64'),
+            'clinical_significance': self.map_clinical_significance(
+                extract(_info_re('CLNSIG'), expand=False)),
+            'disease_name': extract(_info_re('CLNDN'), expand=False),
+            'gene_symbol': gene_parts[0],
+            'gene_id': gene_parts[1],
+            'info_raw': info,
+            'chrom_code': chrom_codes,
+        }, columns=VARIANT_FIELDS)
+
+    def _iter_vcf_chunks(self, input_path: str, chunksize: int, max_rows: Optional[int]):
+        """Yield transformed variant DataFrames chunk by chunk
+
+        Uses the pandas C tokenizer (sep='\\t', comment='#') so line
+        splitting happens outside the interpreter; peak memory stays at
+        one chunk regardless of VCF size.
 
-        # Temporary file for intermediate results
-        temp_variants_csv = self.variants_csv + '.tmp'
+        Args:
+            input_path: Path to VCF file (.gz handled transparently)
+            chunksize: Rows per chunk
+            max_rows: Maximum total rows to yield (None for all)
 
-        # Clean up any existing temp file to avoid duplicate headers
-        import os
-        if os.path.exists(temp_variants_csv):
-            os.remove(temp_variants_csv)
-            logger.info("Removed existing temporary file")
+        Yields:
+            DataFrames with VARIANT_FIELDS columns
+        """
+        # Uncompressed input: hand the tokenizer an mmap of the file and
+        # hint sequential access so the kernel prefetches ahead and drops
+        # pages behind - one copy fewer than the buffered IO stack. The
+        # header is skipped by seeking past it / counting its lines, not
+        # with comment='#', which would truncate records at '#' bytes
+        # inside ID or INFO values
+        f = mm = None
+        skiprows = 0
+        if input_path.endswith('.gz'):
+            source = input_path
+            skiprows = self._count_header_lines(input_path)
+        else:
+            f = open(input_path, 'rb')
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.seek(self._find_data_start(mm))
+            source = mm
 
-        first_chunk = True
-        total_variants = 0
-        chunk_buffer = []
+        try:
+            reader = pd.read_csv(
+                source, sep='\t', header=None, skiprows=skiprows,
+                names=_RAW_VCF_COLUMNS, usecols=range(8),
+                dtype=_RAW_VCF_DTYPES, chunksize=chunksize, engine='c')
+
+            remaining = max_rows
+            for chunk in reader:
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    chunk = chunk.iloc[:remaining]
+                    remaining -= len(chunk)
+                yield self._transform_chunk(chunk)
+        finally:
+            if mm is not None:
+                mm.close()
+            if f is not None:
+                f.close()
+
+    @staticmethod
+    def _find_data_start(mm) -> int:
+        """Locate the first data byte after the VCF header
+
+        One bytes.find for the #CHROM line instead of iterating header
+        lines as Python string objects.
+
+        Args:
+            mm: mmap (or bytes-like) view of the VCF file
+
+        Returns:
+            Byte offset of the first variant record (file size if none)
+        """
+        header_pos = mm.find(b'#CHROM')
+        if header_pos == -1:
+            return 0
+        newline = mm.find(b'\n', header_pos)
+        return len(mm) if newline == -1 else newline + 1
 
-        with open_func(input_path, mode) as f:
-            # Skip header lines
+    @staticmethod
+    def _count_header_lines(input_path: str) -> int:
+        """Count the leading '#' header lines of a VCF file
+
+        Lets readers skip the header by row count; skipping via
+        comment='#' would also truncate records at '#' bytes inside
+        ID or INFO free-text values.
+
+        Args:
+            input_path: Path to VCF file (.gz handled transparently)
+
+        Returns:
+            Number of header lines before the first variant record
+        """
+        open_func = gzip.open if input_path.endswith('.gz') else open
+        n_header = 0
+        with open_func(input_path, 'rb') as f:
             for line in f:
-                if line.startswith('#CHROM'):
-                    break
-                elif not line.startswith('#'):
+                if not line.startswith(b'#'):
                     break
+                n_header += 1
+        return n_header
 
-            # Parse variant lines in chunks
-            line_count = 0
-            for line in tqdm(f, desc="Parsing VCF"):
-                if line.startswith('#'):
-                    continue
-
-                parts = line.strip().split('\t')
-                if len(parts) < 8:
-                    continue
-
-                chrom = parts[0]
-                pos = int(parts[1])
-                variant_id = parts[2] if parts[2] != '.' else None
-                ref = parts[3]
-                alt = parts[4]
-                qual = parts[5] if parts[5] != '.' else None
-                filter_status = parts[6]
-                info = parts[7]
+    @staticmethod
+    def _count_data_columns(input_path: str) -> int:
+        """Count the data columns declared by the #CHROM header line
 
-                # Extract INFO fields
-                af = self._parse_info_field(info, 'AF')
-                ac = self._parse_info_field(info, 'AC')
-                an = self._parse_info_field(info, 'AN')
-                clnsig = self._parse_info_field(info, 'CLNSIG')
-                clndn = self._parse_info_field(info, 'CLNDN')
+        VCFs with genotype data carry FORMAT plus one column per sample
+        after INFO; readers that must declare the full row width up
+        front (Arrow rejects wider rows) can prescan it here.
 
-                # Extract gene information
-                gene_symbol, gene_id = self._extract_gene_info(info)
+        Args:
+            input_path: Path to VCF file (.gz handled transparently)
 
-                # Parse clinical significance
-                clinical_significance = self._parse_clinical_significance(clnsig)
+        Returns:
+            Number of tab-separated columns (at least the 8 standard)
+        """
+        open_func = gzip.open if input_path.endswith('.gz') else open
+        with open_func(input_path, 'rb') as f:
+            for line in f:
+                if line.startswith(b'#CHROM') or not line.startswith(b'#'):
+                    return max(len(line.rstrip(b'\r\n').split(b'\t')),
+                               len(_RAW_VCF_COLUMNS))
+        return len(_RAW_VCF_COLUMNS)
 
-                variant = {
-                    'chromosome': chrom,
-                    'position': pos,
-                    'variant_id': variant_id,
-                    'reference_allele': ref,
-                    'alternate_allele': alt,
-                    'quality': qual,
-                    'filter': filter_status,
-                    'allele_frequency': float(af) if af else None,
-                    'allele_count': int(ac) if ac else None,
-                    'total_alleles': int(an) if an else None,
-                    'clinical_significance': clinical_significance,
-                    'disease_name': clndn,
-                    'gene_symbol': gene_symbol,
-                    'gene_id': gene_id,
-                    'info_raw': info
-                }
+    @staticmethod
+    def _align_to_line(mm, offset: int) -> int:
+        """Round a byte offset down to the start of its line
+
+        Args:
+            mm: mmap (or bytes-like) view of the VCF file
+            offset: Arbitrary byte offset
+
+        Returns:
+            Offset of the first byte of the line containing offset
+        """
+        return mm.rfind(b'\n', 0, offset) + 1
+
+    def _parse_byte_range(self, input_path: str, start: int, end: int) -> pd.DataFrame:
+        """Parse one newline-aligned byte range into transformed variants
+
+        Runs in a worker process; reads only its slice of the file and
+        returns a DataFrame in the output schema.
+
+        Args:
+            input_path: Path to uncompressed VCF file
+            start: Byte offset of the first line in the range
+            end: Byte offset one past the last line in the range
+
+        Returns:
+            DataFrame with VARIANT_FIELDS columns
+        """
+        with open(input_path, 'rb') as f:
+            f.seek(start)
+            buf = f.read(end - start)
+
+        # Ranges start at/after the data start, so no header handling
+        # (and no comment='#', which would corrupt '#' bytes in values)
+        chunk = pd.read_csv(
+            io.BytesIO(buf), sep='\t', header=None,
+            names=_RAW_VCF_COLUMNS, usecols=range(8),
+            dtype=_RAW_VCF_DTYPES, engine='c')
+        return self._transform_chunk(chunk)
+
+    @log_execution_time
+    def parse_vcf_arrow(self, input_path: Optional[str] = None) -> pd.DataFrame:
+        """Parse VCF file with the multithreaded Arrow CSV reader
+
+        pyarrow.csv.read_csv tokenizes on all cores and builds columnar
+        Arrow buffers directly, unlike the single-threaded pandas C
+        engine. A cheap prescan counts header lines so Arrow can skip
+        them without comment handling.
+
+        Args:
+            input_path: Path to VCF file (.gz handled transparently)
+
+        Returns:
+            DataFrame with parsed variants
+        """
+        if input_path is None:
+            input_path = self.resolved_input
+
+        logger.info(f"Parsing VCF file with Arrow CSV reader: {input_path}")
+
+        n_header = self._count_header_lines(input_path)
+
+        # Declare the real row width (FORMAT/sample columns included) so
+        # Arrow accepts genotype-bearing VCFs like the pandas paths do;
+        # only the 8 standard columns are converted and kept
+        n_cols = self._count_data_columns(input_path)
+        column_names = _RAW_VCF_COLUMNS + [
+            f'extra_{i}' for i in range(len(_RAW_VCF_COLUMNS), n_cols)]
+
+        table = pa_csv.read_csv(
+            input_path,
+            read_options=pa_csv.ReadOptions(
+                skip_rows=n_header, column_names=column_names),
+            parse_options=pa_csv.ParseOptions(delimiter='\t'),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=_RAW_VCF_COLUMNS,
+                column_types={
+                    # int32 indices: the only dictionary index type the
+                    # CSV reader supports; to_pandas yields category dtype
+                    'chromosome': pa.dictionary(pa.int32(), pa.string()),
+                    'position': pa.uint32(),
+                    'variant_id': pa.string(),
+                    'reference_allele': pa.string(),
+                    'alternate_allele': pa.string(),
+                    'quality': pa.string(),
+                    'filter': pa.string(),
+                    'info_raw': pa.string(),
+                }))
+
+        variants_df = self._transform_chunk(table.to_pandas())
+        logger.info(f"Parsed {len(variants_df):,} variants with Arrow")
+        return variants_df
 
-                chunk_buffer.append(variant)
-                line_count += 1
+    @log_execution_time
+    def parse_vcf_parallel(self, input_path: Optional[str] = None,
+                           n_workers: Optional[int] = None) -> pd.DataFrame:
+        """Parse VCF file in parallel over newline-aligned byte ranges
+
+        VCF is line-delimited and trivially splittable: the file is
+        mmap'd once to locate the data start and newline-aligned split
+        points, then each worker process tokenizes and transforms its
+        own byte range, and the per-range DataFrames are concatenated.
+
+        Args:
+            input_path: Path to uncompressed VCF file
+            n_workers: Number of worker processes (defaults to CPU count)
+
+        Returns:
+            DataFrame with parsed variants
+        """
+        if input_path is None:
+            input_path = self.resolved_input
+
+        if input_path.endswith('.gz'):
+            # gzip streams aren't seekable at arbitrary offsets
+            logger.warning("Parallel parsing needs an uncompressed VCF - using serial parser")
+            return self.parse_vcf_simple(input_path)
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
 
-                # Write chunk when buffer is full
-                if len(chunk_buffer) >= self.chunk_size:
-                    chunk_df = pd.DataFrame(chunk_buffer)
-                    chunk_df.to_csv(temp_variants_csv, mode='a', header=first_chunk, index=False)
-                    total_variants += len(chunk_buffer)
-                    chunk_buffer = []
-                    first_chunk = False
+        logger.info(f"Parsing VCF file with {n_workers} workers: {input_path}")
 
-                    logger.info(f"Processed {total_variants:,} variants so far...")
+        with open(input_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = mm.size()
+            data_start = self._find_data_start(mm)
 
-                if max_rows and line_count >= max_rows:
+            # Split points rounded down to line boundaries
+            bounds = [data_start]
+            step = max(1, (size - data_start) // n_workers)
+            for i in range(1, n_workers):
+                target = data_start + i * step
+                if target >= size:
                     break
+                pos = max(self._align_to_line(mm, target), data_start)
+                if pos > bounds[-1]:
+                    bounds.append(pos)
+            if size > bounds[-1]:
+                bounds.append(size)
+
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        if not ranges:
+            return pd.DataFrame(columns=VARIANT_FIELDS)
+
+        if len(ranges) == 1:
+            frames = [self._parse_byte_range(input_path, *ranges[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                frames = list(pool.map(
+                    self._parse_byte_range,
+                    [input_path] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges]))
 
-            # Write remaining variants in buffer
-            if chunk_buffer:
-                chunk_df = pd.DataFrame(chunk_buffer)
-                chunk_df.to_csv(temp_variants_csv, mode='a', header=first_chunk, index=False)
-                total_variants += len(chunk_buffer)
+        variants_df = pd.concat(frames, ignore_index=True)
+        logger.info(f"Parsed {len(variants_df):,} variants with {len(ranges)} workers")
+        return variants_df
 
-        logger.info(f"Parsed {total_variants:,} variants using chunked processing")
+    @log_execution_time
+    def parse_vcf_simple(self, input_path: Optional[str] = None, max_rows: Optional[int] = None,
+                         chunksize: Optional[int] = None) -> pd.DataFrame:
+        """Parse VCF file using simple text parsing with chunked processing (memory-efficient)
+
+        Args:
+            input_path: Path to VCF file
+            max_rows: Maximum number of rows to parse (None for all)
+            chunksize: If given, return an iterator of per-chunk
+                DataFrames (C-engine tokenizer, constant memory) instead
+                of writing the CSV and returning one DataFrame
+
+        Returns:
+            DataFrame with parsed variants, or an iterator of chunk
+            DataFrames when chunksize is given
+        """
+        if input_path is None:
+            input_path = self.resolved_input
+
+        if chunksize is not None:
+            logger.info(f"Streaming VCF in chunks of {chunksize}: {input_path}")
+            return self._iter_vcf_chunks(input_path, chunksize, max_rows)
+
+        logger.info(f"Parsing VCF file: {input_path}")
+        logger.info(f"Using memory-efficient chunked processing (chunk size: {self.chunk_size})")
+
+        # Process in chunks and write directly to CSV to avoid memory issues
+        is_gzipped = input_path.endswith('.gz')
+        open_func = gzip.open if is_gzipped else open
+        mode = 'rt' if is_gzipped else 'r'
 
-        # For large datasets, don't load back into memory - just rename the temp file
-        # This avoids memory issues with 40M+ variants
         import os
-        import shutil
+
+        total_variants = 0
+
+        # Buffer columns as a dict-of-lists (SoA) instead of one 15-key dict
+        # per row - plain list appends, no per-row dict allocation
+        cols = {name: [] for name in VARIANT_FIELDS}
+
+        # Stream directly to the final CSV - no temp file round-trip.
+        # Rows are written straight from the column buffers without
+        # materializing an intermediate DataFrame per chunk. The header goes
+        # out eagerly so chunk flushes need no first-chunk bookkeeping.
+        f_out = open(self.variants_csv, 'w', newline='')
+        writer = csv.writer(f_out)
+        writer.writerow(VARIANT_FIELDS)
+
+        def flush_chunk():
+            writer.writerows(zip(*(cols[name] for name in VARIANT_FIELDS)))
+            count = len(cols['chromosome'])
+            for col in cols.values():
+                col.clear()
+            return count
+
+        try:
+            with open_func(input_path, mode) as f:
+                # Skip header lines
+                for line in f:
+                    if line.startswith('#CHROM'):
+                        break
+                    elif not line.startswith('#'):
+                        break
+
+                # Parse variant lines in chunks.
+                # Bind hot attributes to locals - LOAD_ATTR on every one of
+                # 40M+ iterations adds up to seconds of pure lookup overhead
+                parse_info_dict = self._parse_info_dict
+                extract_gene = self._extract_gene_info
+                parse_clnsig = self._parse_clinical_significance
+                chunk_size = self.chunk_size
+                app_chrom = cols['chromosome'].append
+                app_pos = cols['position'].append
+                app_vid = cols['variant_id'].append
+                app_ref = cols['reference_allele'].append
+                app_alt = cols['alternate_allele'].append
+                app_qual = cols['quality'].append
+                app_filter = cols['filter'].append
+                app_af = cols['allele_frequency'].append
+                app_ac = cols['allele_count'].append
+                app_an = cols['total_alleles'].append
+                app_clnsig = cols['clinical_significance'].append
+                app_clndn = cols['disease_name'].append
+                app_gene_sym = cols['gene_symbol'].append
+                app_gene_id = cols['gene_id'].append
+                app_info = cols['info_raw'].append
+                app_code = cols['chrom_code'].append
+                code_get = CONTIG_CODES.get
+
+                line_count = 0
+                # Throttled refresh - per-line updates cost real time at 40M+ lines
+                for line in tqdm(f, desc="Parsing VCF", mininterval=5.0, miniters=100000, unit='lines'):
+                    if line.startswith('#'):
+                        continue
+
+                    parts = line.strip().split('\t')
+                    if len(parts) < 8:
+                        continue
+
+                    chrom = parts[0]
+                    pos = int(parts[1])
+                    variant_id = parts[2] if parts[2] != '.' else None
+                    ref = parts[3]
+                    alt = parts[4]
+                    qual = parts[5] if parts[5] != '.' else None
+                    filter_status = parts[6]
+                    info = parts[7]
+
+                    # Parse INFO once, then O(1) key lookups
+                    info_get = parse_info_dict(info).get
+                    af = info_get('AF')
+                    ac = info_get('AC')
+                    an = info_get('AN')
+                    clnsig = info_get('CLNSIG')
+                    clndn = info_get('CLNDN')
+
+                    # Extract gene information
+                    gene_symbol, gene_id = extract_gene(info)
+
+                    # Parse clinical significance
+                    clinical_significance = parse_clnsig(clnsig)
+
+                    app_chrom(chrom)
+                    app_pos(pos)
+                    app_vid(variant_id)
+                    app_ref(ref)
+                    app_alt(alt)
+                    app_qual(qual)
+                    app_filter(filter_status)
+                    app_af(float(af) if af else None)
+                    app_ac(int(ac) if ac else None)
+                    app_an(int(an) if an else None)
+                    app_clnsig(clinical_significance)
+                    app_clndn(clndn)
+                    app_gene_sym(gene_symbol)
+                    app_gene_id(gene_id)
+                    app_info(info)
+                    app_code(code_get(chrom, -1))
+                    line_count += 1
+
+                    # Write chunk when buffer is full
+                    if len(cols['chromosome']) >= chunk_size:
+                        total_variants += flush_chunk()
+                        logger.info(f"Processed {total_variants:,} variants so far...")
+
+                    if max_rows and line_count >= max_rows:
+                        break
+
+                # Write remaining variants in buffer
+                if cols['chromosome']:
+                    total_variants += flush_chunk()
+
+            f_out.close()
+
+        except Exception:
+            # Don't leave a partial CSV behind on failure
+            f_out.close()
+            if os.path.exists(self.variants_csv):
+                os.remove(self.variants_csv)
+            raise
+
+        logger.info(f"Parsed {total_variants:,} variants using chunked processing")
 
         if total_variants > 1000000:  # For datasets > 1M variants
             logger.info(f"Large dataset detected ({total_variants:,} variants)")
             logger.info("Skipping memory load - using CSV file directly")
-
-            # Move temp file to final location
-            if os.path.exists(temp_variants_csv):
-                shutil.move(temp_variants_csv, self.variants_csv)
-                logger.info(f"Saved variants directly to {self.variants_csv}")
+            logger.info(f"Saved variants directly to {self.variants_csv}")
 
             # Return minimal info - actual data is in CSV file
             # This prevents loading 44M rows into memory
@@ -243,17 +1015,13 @@ class VCFTransformer:
         else:
             # For smaller datasets, load into memory as before
             logger.info("Loading dataset into memory...")
-            result_df = pd.read_csv(temp_variants_csv)
-
-            # Clean up temp file
-            if os.path.exists(temp_variants_csv):
-                os.remove(temp_variants_csv)
-
-            return result_df
+            return pd.read_csv(self.variants_csv,
+                               dtype={'chromosome': 'category', 'position': 'uint32',
+                                      'chrom_code': 'int8'})
 
     @log_execution_time
-    def parse_vcf_with_vcfpy(self, input_path: Optional[str] = None, max_rows: Optional[int] = None) -> pd.DataFrame:
-        """Parse VCF file using vcfpy library (more robust)
+    def parse_vcf_with_cyvcf2(self, input_path: Optional[str] = None, max_rows: Optional[int] = None) -> pd.DataFrame:
+        """Parse VCF file using cyvcf2 library (htslib-backed, fast and robust)
 
         Args:
             input_path: Path to VCF file
@@ -263,39 +1031,36 @@ class VCFTransformer:
             DataFrame with parsed variants
         """
         if input_path is None:
-            if file_exists(self.vcf_file_path):
-                input_path = self.vcf_file_path
-            else:
-                input_path = self.vcf_compressed_path
+            input_path = self.resolved_input
 
-        logger.info(f"Parsing VCF file with vcfpy: {input_path}")
+        logger.info(f"Parsing VCF file with cyvcf2: {input_path}")
 
         variants = []
 
         try:
-            reader = vcfpy.Reader.from_path(input_path)
+            reader = VCF(input_path)
 
-            for i, record in enumerate(tqdm(reader, desc="Parsing VCF with vcfpy")):
+            for i, record in enumerate(tqdm(reader, desc="Parsing VCF with cyvcf2", mininterval=5.0, miniters=100000, unit='records')):
                 if max_rows and i >= max_rows:
                     break
 
                 # Extract basic fields
                 chrom = record.CHROM
                 pos = record.POS
-                variant_id = record.ID[0] if record.ID else None
+                variant_id = record.ID
                 ref = record.REF
-                alt = record.ALT[0].value if record.ALT else None
+                alt = record.ALT[0] if record.ALT else None
                 qual = record.QUAL
-                filter_status = ','.join(record.FILTER) if record.FILTER else 'PASS'
+                filter_status = record.FILTER if record.FILTER else 'PASS'
 
                 # Extract INFO fields
                 info = record.INFO
-                af = info.get('AF', [None])[0] if 'AF' in info else None
-                ac = info.get('AC', [None])[0] if 'AC' in info else None
-                an = info.get('AN', None) if 'AN' in info else None
-                clnsig = info.get('CLNSIG', [None])[0] if 'CLNSIG' in info else None
-                clndn = info.get('CLNDN', [None])[0] if 'CLNDN' in info else None
-                geneinfo = info.get('GENEINFO', [None])[0] if 'GENEINFO' in info else None
+                af = info.get('AF')
+                ac = info.get('AC')
+                an = info.get('AN')
+                clnsig = info.get('CLNSIG')
+                clndn = info.get('CLNDN')
+                geneinfo = info.get('GENEINFO')
 
                 # Extract gene information
                 gene_symbol, gene_id = None, None
@@ -323,7 +1088,8 @@ class VCFTransformer:
                     'clinical_significance': clinical_significance,
                     'disease_name': clndn,
                     'gene_symbol': gene_symbol,
-                    'gene_id': gene_id
+                    'gene_id': gene_id,
+                    'chrom_code': CONTIG_CODES.get(chrom, -1)
                 }
 
                 variants.append(variant)
@@ -331,7 +1097,7 @@ class VCFTransformer:
             reader.close()
 
         except Exception as e:
-            logger.warning(f"vcfpy parsing failed: {e}. Falling back to simple parser.")
+            logger.warning(f"cyvcf2 parsing failed: {e}. Falling back to simple parser.")
             return self.parse_vcf_simple(input_path, max_rows)
 
         logger.info(f"Parsed {len(variants)} variants")
@@ -356,34 +1122,38 @@ class VCFTransformer:
             total_variants = variants_df['total_variants'].iloc[0]
             logger.info(f"Large dataset ({total_variants:,} variants) - extracting genes from CSV")
 
-            # Collect unique genes from CSV file in chunks
-            unique_genes = set()
-            gene_data = {}
+            # Collect unique genes from CSV file in chunks - dedupe per chunk
+            # in C via drop_duplicates, then once more across chunks
+            gene_chunks = []
 
-            for chunk in pd.read_csv(csv_path, chunksize=100000, usecols=['gene_symbol', 'gene_id', 'chromosome']):
+            for chunk in pd.read_csv(csv_path, chunksize=100000,
+                                     usecols=['gene_symbol', 'gene_id', 'chromosome'],
+                                     dtype={'chromosome': 'category'}):
                 # Filter out null gene symbols
                 chunk_filtered = chunk[chunk['gene_symbol'].notna()]
-
-                # Store gene info
-                for _, row in chunk_filtered.iterrows():
-                    gene_sym = row['gene_symbol']
-                    if gene_sym not in unique_genes:
-                        unique_genes.add(gene_sym)
-                        gene_data[gene_sym] = {
-                            'gene_symbol': gene_sym,
-                            'gene_id': row['gene_id'],
-                            'chromosome': row['chromosome']
-                        }
-
-            genes_df = pd.DataFrame(list(gene_data.values()))
+                gene_chunks.append(chunk_filtered.drop_duplicates(subset=['gene_symbol']))
+
+            if gene_chunks:
+                genes_df = (
+                    pd.concat(gene_chunks, ignore_index=True)
+                    .drop_duplicates(subset=['gene_symbol'])
+                    .reset_index(drop=True)
+                )[['gene_symbol', 'gene_id', 'chromosome']]
+            else:
+                genes_df = pd.DataFrame(columns=['gene_symbol', 'gene_id', 'chromosome'])
             logger.info(f"Extracted {len(genes_df)} unique genes from large dataset")
             return genes_df
         else:
-            # Small dataset - process in memory as before
-            genes_df = variants_df[['gene_symbol', 'gene_id', 'chromosome']].copy()
-            genes_df = genes_df[genes_df['gene_symbol'].notna()]
-            genes_df = genes_df.drop_duplicates(subset=['gene_symbol'])
-            genes_df = genes_df.reset_index(drop=True)
+            # Small dataset - combine the null filter and the dedupe into
+            # one boolean mask (both are C-level hash passes), then take
+            # the surviving rows in a single selection
+            symbols = variants_df['gene_symbol']
+            unique_mask = symbols.notna() & ~symbols.duplicated(keep='first')
+            genes_df = (
+                variants_df.loc[unique_mask,
+                                ['gene_symbol', 'gene_id', 'chromosome']]
+                .reset_index(drop=True)
+            )
 
             logger.info(f"Extracted {len(genes_df)} unique genes")
             return genes_df
@@ -412,11 +1182,154 @@ class VCFTransformer:
         logger.info("Data saved successfully")
 
     @log_execution_time
-    def transform_all(self, use_vcfpy: bool = False, max_rows: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def save_to_parquet(self, variants_df: pd.DataFrame, chunksize: int = 100000) -> str:
+        """Write variants as a Parquet dataset partitioned by chromosome
+
+        Partitioning lets downstream readers (gene extraction, analysis,
+        DB loading) prune to single chromosomes and read only the columns
+        they need, instead of scanning the whole variants CSV.
+
+        Args:
+            variants_df: Variants DataFrame (may be placeholder for large datasets)
+            chunksize: Rows per chunk when streaming from CSV
+
+        Returns:
+            Path to the Parquet dataset directory
+        """
+        logger.info(f"Writing Parquet dataset to {self.variants_parquet_dir}")
+
+        partitioning = pa_ds.partitioning(
+            pa.schema([('chromosome', pa.string())]), flavor='hive')
+
+        if len(variants_df) < 10 and 'variants_csv' in variants_df.columns:
+            # Large dataset - stream from CSV in chunks instead of loading it
+            csv_path = variants_df['variants_csv'].iloc[0]
+            # Explicit dtypes keep every chunk on the same Arrow schema
+            # (values in one chunk must not steer type inference)
+            reader = pd.read_csv(csv_path, chunksize=chunksize,
+                                 dtype=_VARIANT_CSV_DTYPES)
+
+            first_table = pa.Table.from_pandas(next(reader), preserve_index=False)
+            schema = first_table.schema
+
+            def record_batches():
+                yield from first_table.to_batches()
+                for chunk in reader:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    yield from table.cast(schema).to_batches()
+
+            pa_ds.write_dataset(
+                record_batches(),
+                base_dir=self.variants_parquet_dir,
+                format='parquet',
+                schema=schema,
+                partitioning=partitioning,
+                existing_data_behavior='delete_matching'
+            )
+        else:
+            table = pa.Table.from_pandas(variants_df, preserve_index=False)
+            pa_ds.write_dataset(
+                table,
+                base_dir=self.variants_parquet_dir,
+                format='parquet',
+                partitioning=partitioning,
+                existing_data_behavior='delete_matching'
+            )
+
+        logger.info(f"Parquet dataset written to {self.variants_parquet_dir}")
+        return self.variants_parquet_dir
+
+    @log_execution_time
+    def parse_vcf_columnar(self, input_path: Optional[str] = None) -> VariantColumns:
+        """Parse VCF into a struct of numpy arrays for analytical kernels
+
+        The hot columns come back as contiguous typed arrays (int16
+        chromosome codes, uint32 positions) instead of DataFrame rows,
+        so downstream filters and range scans run as SIMD-friendly
+        numpy passes. Use .to_pandas() where a DataFrame is needed.
+
+        Args:
+            input_path: Path to VCF file (.gz handled transparently)
+
+        Returns:
+            VariantColumns with the parsed columns
+        """
+        if input_path is None:
+            input_path = self.resolved_input
+
+        logger.info(f"Parsing VCF file into columnar arrays: {input_path}")
+
+        raw = pd.read_csv(
+            input_path, sep='\t', header=None,
+            skiprows=self._count_header_lines(input_path),
+            names=_RAW_VCF_COLUMNS, usecols=range(8),
+            dtype=_RAW_VCF_DTYPES, engine='c')
+
+        chrom_cat = raw['chromosome'].cat
+        columns = VariantColumns(
+            chromosomes=tuple(chrom_cat.categories),
+            chrom=chrom_cat.codes.to_numpy(np.int16),
+            pos=raw['position'].to_numpy(np.uint32),
+            ref=raw['reference_allele'].to_numpy(object),
+            alt=raw['alternate_allele'].to_numpy(object),
+            info=raw['info_raw'].to_numpy(object),
+        )
+        logger.info(f"Parsed {len(columns.pos):,} variants into columnar form")
+        return columns
+
+    @log_execution_time
+    def parse_vcf_to_parquet(self, out_path: str, input_path: Optional[str] = None,
+                             chunksize: int = 500000) -> str:
+        """Stream-parse the VCF directly into a single Parquet file
+
+        Chunks flow from the C tokenizer through the vectorized
+        transform into a ParquetWriter, so peak memory is one chunk
+        regardless of VCF size, and the ZSTD-compressed, dictionary-
+        encoded output is typically several times smaller than the
+        equivalent CSV.
+
+        Args:
+            out_path: Path of the Parquet file to write
+            input_path: Path to VCF file (defaults to the configured input)
+            chunksize: Rows per chunk
+
+        Returns:
+            out_path, for reading back lazily (e.g. pd.read_parquet
+            with a column subset, or a pyarrow dataset)
+        """
+        if input_path is None:
+            input_path = self.resolved_input
+
+        logger.info(f"Streaming VCF to Parquet: {input_path} -> {out_path}")
+
+        writer = None
+        total_variants = 0
+        try:
+            for chunk in self._iter_vcf_chunks(input_path, chunksize, None):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    # First chunk fixes the schema; later chunks cast to
+                    # it (their category dictionaries may differ)
+                    writer = pq.ParquetWriter(out_path, table.schema,
+                                              compression='zstd',
+                                              use_dictionary=True)
+                else:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+                total_variants += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        logger.info(f"Wrote {total_variants:,} variants to {out_path}")
+        return out_path
+
+    @log_execution_time
+    def transform_all(self, use_cyvcf2: bool = False, max_rows: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Complete transformation pipeline
 
         Args:
-            use_vcfpy: Use vcfpy library instead of simple parser
+            use_cyvcf2: Use cyvcf2 library instead of simple parser
             max_rows: Maximum number of rows to process
 
         Returns:
@@ -425,8 +1338,8 @@ class VCFTransformer:
         logger.info("Starting VCF transformation pipeline")
 
         # Parse VCF
-        if use_vcfpy:
-            variants_df = self.parse_vcf_with_vcfpy(max_rows=max_rows)
+        if use_cyvcf2:
+            variants_df = self.parse_vcf_with_cyvcf2(max_rows=max_rows)
         else:
             variants_df = self.parse_vcf_simple(max_rows=max_rows)
 
@@ -436,6 +1349,10 @@ class VCFTransformer:
         # Save to CSV
         self.save_to_csv(variants_df, genes_df)
 
+        # Optionally emit a chromosome-partitioned Parquet dataset
+        if self.config['processing'].get('write_parquet', False):
+            self.save_to_parquet(variants_df)
+
         logger.info("VCF transformation pipeline completed successfully")
         return variants_df, genes_df
 
@@ -446,7 +1363,7 @@ def main():
 
     try:
         # Transform VCF data
-        variants_df, genes_df = transformer.transform_all(use_vcfpy=False)
+        variants_df, genes_df = transformer.transform_all(use_cyvcf2=False)
 
         logger.info(f"Transformed {len(variants_df)} variants")
         logger.info(f"Extracted {len(genes_df)} genes")
@@ -59,12 +59,12 @@ class GenomicPipeline:
         return vcf_path
 
     @log_execution_time
-    def run_transformation(self, max_rows: Optional[int] = None, use_vcfpy: bool = False):
+    def run_transformation(self, max_rows: Optional[int] = None, use_cyvcf2: bool = False):
         """Run VCF transformation phase
 
         Args:
             max_rows: Maximum number of rows to process (None for all)
-            use_vcfpy: Use vcfpy library for parsing
+            use_cyvcf2: Use cyvcf2 library for parsing
 
         Returns:
             Tuple of (variants_df, genes_df)
@@ -74,7 +74,7 @@ class GenomicPipeline:
         logger.info("=" * 80)
 
         variants_df, genes_df = self.transformer.transform_all(
-            use_vcfpy=use_vcfpy,
+            use_cyvcf2=use_cyvcf2,
             max_rows=max_rows
         )
 
@@ -186,7 +186,7 @@ class GenomicPipeline:
             self.run_extraction(force=force_download)
 
             # Phase 2: Transformation
-            self.run_transformation(max_rows=max_rows, use_vcfpy=False)
+            self.run_transformation(max_rows=max_rows, use_cyvcf2=False)
 
             # Phase 3: Enrichment (optional)
             if not skip_enrichment:
@@ -270,8 +270,8 @@ Examples:
                        help='Skip enrichment phase in full pipeline')
     parser.add_argument('--skip-analysis', action='store_true',
                        help='Skip analysis phase in full pipeline')
-    parser.add_argument('--use-vcfpy', action='store_true',
-                       help='Use vcfpy library for parsing (slower but more robust)')
+    parser.add_argument('--use-cyvcf2', action='store_true',
+                       help='Use cyvcf2 library for parsing (htslib-backed, fast and robust)')
 
     args = parser.parse_args()
 
@@ -296,7 +296,7 @@ Examples:
         elif args.transform:
             pipeline.run_transformation(
                 max_rows=args.max_rows,
-                use_vcfpy=args.use_vcfpy
+                use_cyvcf2=args.use_cyvcf2
             )
 
         elif args.enrich:
@@ -14,7 +14,8 @@ from .file_utils import (
     ensure_directory,
     load_config,
     file_exists,
-    create_backup
+    create_backup,
+    clear_stat_cache
 )
 
 __all__ = [
@@ -33,5 +34,6 @@ __all__ = [
     'load_config',
     'file_exists',
     'create_backup',
+    'clear_stat_cache',
 ]
 
@@ -0,0 +1,105 @@
+"""
+Shared caches for parsed YAML configuration files and file stats
+
+Kept free of package-internal imports so logger, db_config, and
+file_utils can all use it without circular imports.
+"""
+import json
+import os
+from functools import lru_cache
+
+import yaml
+
+# orjson parses/serializes JSON 3-10x faster than the stdlib; fall back
+# to json when it isn't installed (byte-oriented API either way)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Prefer the libyaml-backed C loader (~10x faster than the pure-Python
+# parser); fall back when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed configs keyed by (absolute path, mtime in ns). Re-parses only
+# when the file changes; repeated loads within a process are dict lookups.
+_YAML_CACHE = {}
+
+
+@lru_cache(maxsize=4096)
+def stat_cached(path: str):
+    """os.stat with memoization for paths that are stat'd repeatedly
+
+    Only successful stats are cached (lru_cache does not cache raised
+    exceptions), so a missing file re-stats on the next call.
+
+    Args:
+        path: Path to stat
+
+    Returns:
+        os.stat_result for the path
+    """
+    return os.stat(path)
+
+
+def clear_stat_cache():
+    """Drop all memoized stat results (e.g. in test teardown)"""
+    stat_cached.cache_clear()
+
+
+def load_yaml_config(config_path: str) -> dict:
+    """Load a YAML configuration file with mtime-keyed memoization
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Configuration dictionary (shared instance - treat as read-only)
+    """
+    st = stat_cached(config_path)
+    key = (os.path.abspath(config_path), st.st_mtime_ns)
+
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # JSON sidecar: parsing JSON is 10-30x cheaper than YAML, so reuse a
+    # .cache.json written on a previous run while the YAML is unchanged
+    cache_path = config_path + '.cache.json'
+    try:
+        if os.stat(cache_path).st_mtime_ns >= st.st_mtime_ns:
+            with open(cache_path, 'rb') as f:
+                config = _json_loads(f.read())
+            _YAML_CACHE[key] = config
+            return config
+    except (OSError, ValueError):
+        pass
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+
+    _YAML_CACHE[key] = config
+
+    # Only write the sidecar when JSON round-trips the document exactly
+    # (JSON would e.g. stringify integer mapping keys); failures to write
+    # are non-fatal - the in-memory cache still applies
+    try:
+        serialized = _json_dumps(config)
+        if _json_loads(serialized) == config:
+            with open(cache_path, 'wb') as f:
+                f.write(serialized)
+    except (OSError, TypeError, ValueError):
+        pass
+
+    return config
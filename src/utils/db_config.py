@@ -2,11 +2,15 @@
 Database configuration and connection management
 NOTE: This module is for MySQL (legacy). MongoDB is now used via load_to_mysql.py
 """
+import contextlib
 import yaml
 import os
+from dataclasses import dataclass
 from typing import Optional
 import logging
 
+from .config_cache import load_yaml_config
+
 # Optional MySQL imports - only needed if using MySQL backend
 try:
     from sqlalchemy import create_engine, event
@@ -22,6 +26,30 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _stamp_pid(dbapi_conn, connection_record):
+    """Record the creating process id on a new pooled connection"""
+    connection_record.info.setdefault('pid', os.getpid())
+
+
+@dataclass(frozen=True, slots=True)
+class DBSettings:
+    """Database settings frozen at config-load time
+
+    Attribute loads are cheaper than repeated dict indexing for the
+    accessors called from per-batch insert loops.
+    """
+    host: str
+    port: int
+    database: str
+    user: Optional[str]
+    password: Optional[str]
+    charset: Optional[str]
+    pool_size: int
+    max_overflow: int
+    tables: dict
+    connection_string: str
+
+
 class DatabaseConfig:
     """Manages database configuration and connections"""
 
@@ -33,14 +61,16 @@ class DatabaseConfig:
         """
         self.config_path = config_path
         self.config = self._load_config()
+        self.settings = self._build_settings()
+        self._conn_str = None
+        self._raw_pool = None
         self.engine = None
         self.Session = None
 
     def _load_config(self) -> dict:
-        """Load database configuration from YAML file"""
+        """Load database configuration from YAML file (cached on path and mtime)"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_config(self.config_path)
             logger.info(f"Database configuration loaded from {self.config_path}")
             return config
         except FileNotFoundError:
@@ -50,11 +80,27 @@ class DatabaseConfig:
             logger.error(f"Error parsing YAML configuration: {e}")
             raise
 
+    def _build_settings(self) -> DBSettings:
+        """Partial-evaluate the parsed config into a frozen DBSettings"""
+        db_config = self.config.get('database', {})
+        return DBSettings(
+            host=db_config.get('host', 'localhost'),
+            port=db_config.get('port', 3306),
+            database=db_config.get('database', ''),
+            user=db_config.get('user'),
+            password=db_config.get('password'),
+            charset=db_config.get('charset'),
+            pool_size=db_config.get('pool_size', 25),
+            max_overflow=db_config.get('max_overflow', 50),
+            tables=self.config.get('tables', {}),
+            connection_string=self.config.get('connection_string', ''),
+        )
+
     def get_connection_string(self) -> str:
-        """Generate SQLAlchemy connection string"""
-        db_config = self.config['database']
-        conn_str = self.config['connection_string'].format(**db_config)
-        return conn_str
+        """Generate SQLAlchemy connection string (formatted once and cached)"""
+        if self._conn_str is None:
+            self._conn_str = self.settings.connection_string.format(**self.config['database'])
+        return self._conn_str
 
     def get_engine(self):
         """Create and return SQLAlchemy engine"""
@@ -65,17 +111,33 @@ class DatabaseConfig:
             self.engine = create_engine(
                 conn_str,
                 poolclass=QueuePool,
-                pool_size=perf_config.get('pool_size', 10),
-                max_overflow=perf_config.get('max_overflow', 20),
+                # Sized for concurrent ingest workers; the MySQL server's
+                # max_connections must be >= pool_size + max_overflow
+                pool_size=self.settings.pool_size,
+                max_overflow=self.settings.max_overflow,
                 pool_timeout=perf_config.get('pool_timeout', 30),
                 pool_recycle=perf_config.get('pool_recycle', 3600),
+                # LIFO reuses the most recently returned connection (better
+                # cache locality, lets idle overflow connections time out)
+                pool_use_lifo=perf_config.get('pool_use_lifo', True),
+                # Detect dead sockets before handing them to user code
+                pool_pre_ping=True,
+                # Batch bulk inserts as multi-row INSERT ... VALUES
+                # statements - one round trip per page instead of per row
+                use_insertmanyvalues=True,
+                insertmanyvalues_page_size=perf_config.get('executemany_page_size', 1000),
+                # Compiled-statement cache; the default (500) is small for
+                # a loader cycling through many table/parameter variants
+                query_cache_size=perf_config.get('query_cache_size', 2048),
+                # Pin the isolation level rather than inheriting whatever
+                # the server/driver defaults to
+                isolation_level=perf_config.get('isolation_level', 'READ COMMITTED'),
                 echo=False
             )
 
-            # Add event listener for connection checkout
-            @event.listens_for(self.engine, "connect")
-            def receive_connect(dbapi_conn, connection_record):
-                connection_record.info['pid'] = os.getpid()
+            # Stamp connections with their creating pid (module-level
+            # listener - no closure rebuilt per engine)
+            event.listen(self.engine, "connect", _stamp_pid)
 
             logger.info("Database engine created successfully")
 
@@ -90,20 +152,27 @@ class DatabaseConfig:
         return self.Session()
 
     def get_raw_connection(self):
-        """Get raw MySQL connection using mysql-connector"""
+        """Get raw MySQL connection from a small connection pool
+
+        Pooled connections skip the per-call TCP + auth handshake;
+        conn.close() returns the connection to the pool for reuse.
+        """
         db_config = self.config['database']
 
         try:
-            connection = mysql.connector.connect(
-                host=db_config['host'],
-                port=db_config['port'],
-                database=db_config['database'],
-                user=db_config['user'],
-                password=db_config['password'],
-                charset=db_config['charset']
-            )
-            logger.info("Raw MySQL connection established")
-            return connection
+            if self._raw_pool is None:
+                self._raw_pool = mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name='gdp',
+                    pool_size=self.get_performance_config().get('raw_pool_size', 5),
+                    host=db_config['host'],
+                    port=db_config['port'],
+                    database=db_config['database'],
+                    user=db_config['user'],
+                    password=db_config['password'],
+                    charset=db_config['charset']
+                )
+                logger.info("Raw MySQL connection pool created")
+            return self._raw_pool.get_connection()
         except mysql.connector.Error as e:
             logger.error(f"Error connecting to MySQL: {e}")
             raise
@@ -111,12 +180,15 @@ class DatabaseConfig:
     def test_connection(self) -> bool:
         """Test database connection"""
         try:
+            # Close the connection even if the probe query raises -
+            # leaked connections eventually exhaust max_connections
             conn = self.get_raw_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            try:
+                with contextlib.closing(conn.cursor()) as cursor:
+                    cursor.execute("SELECT 1")
+                    result = cursor.fetchone()
+            finally:
+                conn.close()
 
             if result[0] == 1:
                 logger.info("Database connection test successful")
@@ -139,13 +211,13 @@ class DatabaseConfig:
                 password=db_config['password']
             )
 
-            cursor = connection.cursor()
-            db_name = db_config['database']
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
-            logger.info(f"Database '{db_name}' created or already exists")
-
-            cursor.close()
-            connection.close()
+            try:
+                with contextlib.closing(connection.cursor()) as cursor:
+                    db_name = db_config['database']
+                    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+                    logger.info(f"Database '{db_name}' created or already exists")
+            finally:
+                connection.close()
 
         except mysql.connector.Error as e:
             logger.error(f"Error creating database: {e}")
@@ -160,7 +232,7 @@ class DatabaseConfig:
         Returns:
             Table name
         """
-        return self.config['tables'].get(table_key, table_key)
+        return self.settings.tables.get(table_key, table_key)
 
     def get_performance_config(self) -> dict:
         """Get performance configuration"""
@@ -168,6 +240,9 @@ class DatabaseConfig:
 
     def close(self):
         """Close database connections"""
+        if self._raw_pool is not None:
+            self._raw_pool._remove_connections()
+            self._raw_pool = None
         if self.engine:
             self.engine.dispose()
             logger.info("Database connections closed")
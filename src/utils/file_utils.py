@@ -2,26 +2,67 @@
 File utility functions for compression, decompression, and parsing
 """
 import gzip
+import io
+import math
+import mmap
 import shutil
 import os
 from typing import Optional, Iterator
 import requests
 from tqdm import tqdm
-import yaml
 from pathlib import Path
 
+from stat import S_ISREG
+
+from ..utils.config_cache import load_yaml_config, stat_cached, clear_stat_cache
 from ..utils.logger import get_logger
 
+# Prefer the ISA-L backed igzip (3-5x stdlib gzip with the same API);
+# fall back to the stdlib when it isn't installed
+try:
+    from isal import igzip as _gzip_impl
+except ImportError:
+    _gzip_impl = gzip
+
+# Optional parallel decompressor - decodes chunk-indexed gzip streams on
+# all cores, an order of magnitude faster than single-threaded gunzip
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
 logger = get_logger(__name__)
 
+# 1 MiB read-ahead instead of the stdlib's 8 KiB default
+_GZIP_BUFFER_SIZE = 1024 * 1024
+
+
+def _open_gz(path: str, mode: str = 'rt'):
+    """Open a gzip file through the fastest available decompressor
+
+    Args:
+        path: Path to gzipped file
+        mode: File mode ('rb' or 'rt')
+
+    Returns:
+        File object with 1 MiB buffering
+    """
+    if 'r' in mode and 'b' not in mode:
+        raw = _gzip_impl.open(path, 'rb')
+        return io.TextIOWrapper(io.BufferedReader(raw, buffer_size=_GZIP_BUFFER_SIZE))
+
+    raw = _gzip_impl.open(path, mode)
+    if 'r' in mode:
+        return io.BufferedReader(raw, buffer_size=_GZIP_BUFFER_SIZE)
+    return raw
+
 
-def download_file(url: str, output_path: str, chunk_size: int = 8192) -> bool:
+def download_file(url: str, output_path: str) -> bool:
     """Download file from URL with progress bar
 
     Args:
         url: URL to download from
         output_path: Path to save downloaded file
-        chunk_size: Size of chunks to download
 
     Returns:
         True if successful, False otherwise
@@ -32,21 +73,25 @@ def download_file(url: str, output_path: str, chunk_size: int = 8192) -> bool:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
 
-        total_size = int(response.headers.get('content-length', 0))
+            total_size = int(response.headers.get('content-length', 0))
 
-        with open(output_path, 'wb') as f, tqdm(
-            desc=os.path.basename(output_path),
-            total=total_size,
-            unit='iB',
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as progress_bar:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                size = f.write(chunk)
-                progress_bar.update(size)
+            # Copy from the raw socket in C with a 1 MiB buffer instead of
+            # allocating a bytes object per 8 KiB through iter_content
+            response.raw.decode_content = True
+
+            with open(output_path, 'wb') as f, tqdm.wrapattr(
+                response.raw,
+                'read',
+                desc=os.path.basename(output_path),
+                total=total_size,
+                unit='iB',
+                unit_scale=True,
+                unit_divisor=1024,
+            ) as raw:
+                shutil.copyfileobj(raw, f, length=1024 * 1024)
 
         logger.info(f"File downloaded successfully to {output_path}")
         return True
@@ -74,19 +119,27 @@ def decompress_gzip(input_path: str, output_path: Optional[str] = None) -> str:
 
         file_size = os.path.getsize(input_path)
 
-        with gzip.open(input_path, 'rb') as f_in, open(output_path, 'wb') as f_out, tqdm(
+        if rapidgzip is not None:
+            # Parallel chunk decompression across all cores
+            with rapidgzip.open(input_path, parallelization=os.cpu_count()) as f_in, \
+                    open(output_path, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, length=4 * 1024 * 1024)
+
+            logger.info(f"File decompressed to {output_path}")
+            return output_path
+
+        # copyfileobj stays in C with a 1 MiB buffer; the tqdm wrapper
+        # ticks the progress bar from the write side
+        with _open_gz(input_path, 'rb') as f_in, open(output_path, 'wb') as f_out, tqdm.wrapattr(
+            f_out,
+            'write',
             desc="Decompressing",
             total=file_size,
             unit='iB',
             unit_scale=True,
             unit_divisor=1024,
-        ) as progress_bar:
-            while True:
-                chunk = f_in.read(8192)
-                if not chunk:
-                    break
-                f_out.write(chunk)
-                progress_bar.update(len(chunk))
+        ) as wrapped_out:
+            shutil.copyfileobj(f_in, wrapped_out, length=1024 * 1024)
 
         logger.info(f"File decompressed to {output_path}")
         return output_path
@@ -124,35 +177,55 @@ def compress_gzip(input_path: str, output_path: Optional[str] = None) -> str:
 
 
 def read_file_in_chunks(file_path: str, chunk_size: int = 10000) -> Iterator[list]:
-    """Read file line by line in chunks
+    """Read file in chunks of lines using block I/O
+
+    Reads 4 MiB blocks and splits them with bytes.splitlines (which runs
+    in C) instead of paying per-line interpreter overhead. Lines are
+    yielded as bytes with line endings stripped.
 
     Args:
         file_path: Path to file
         chunk_size: Number of lines per chunk
 
     Yields:
-        List of lines
+        List of lines (bytes)
     """
     try:
-        chunk = []
-
-        # Determine if file is gzipped
+        block_size = 4 * 1024 * 1024
         is_gzipped = file_path.endswith('.gz')
+        opener = _open_gz if is_gzipped else open
+
+        pending = []
+        tail = b''
+
+        with opener(file_path, 'rb') as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+
+                block = tail + block
+                lines = block.splitlines()
 
-        open_func = gzip.open if is_gzipped else open
-        mode = 'rt' if is_gzipped else 'r'
+                # The block usually ends mid-line - carry the partial
+                # line over to the next block
+                if block.endswith(b'\n'):
+                    tail = b''
+                else:
+                    tail = lines.pop() if lines else b''
 
-        with open_func(file_path, mode) as f:
-            for line in f:
-                chunk.append(line.strip())
+                pending.extend(lines)
 
-                if len(chunk) >= chunk_size:
-                    yield chunk
-                    chunk = []
+                while len(pending) >= chunk_size:
+                    yield pending[:chunk_size]
+                    del pending[:chunk_size]
 
-            # Yield remaining lines
-            if chunk:
-                yield chunk
+        if tail:
+            pending.append(tail)
+
+        # Yield remaining lines
+        if pending:
+            yield pending
 
     except Exception as e:
         logger.error(f"Error reading file in chunks: {e}")
@@ -168,7 +241,11 @@ def get_file_size(file_path: str) -> int:
     Returns:
         File size in bytes
     """
-    return os.path.getsize(file_path)
+    return stat_cached(file_path).st_size
+
+
+# Units indexed by log2(size) // 10 - no loop over magnitudes needed
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 def get_file_size_readable(file_path: str) -> str:
@@ -182,12 +259,8 @@ def get_file_size_readable(file_path: str) -> str:
     """
     size = get_file_size(file_path)
 
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-
-    return f"{size:.2f} PB"
+    index = 0 if size <= 0 else min(len(_SIZE_UNITS) - 1, int(math.log2(size)) // 10)
+    return f"{size / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def count_lines(file_path: str) -> int:
@@ -200,12 +273,36 @@ def count_lines(file_path: str) -> int:
         Number of lines
     """
     try:
-        is_gzipped = file_path.endswith('.gz')
-        open_func = gzip.open if is_gzipped else open
-        mode = 'rt' if is_gzipped else 'r'
-
-        with open_func(file_path, mode) as f:
-            count = sum(1 for _ in f)
+        count = 0
+        last_byte = b''
+
+        if file_path.endswith('.gz'):
+            # Stream and count newlines per 4 MiB block - the count runs
+            # in C, no per-line iteration
+            with _open_gz(file_path, 'rb') as f:
+                while True:
+                    block = f.read(4 * 1024 * 1024)
+                    if not block:
+                        break
+                    count += block.count(b'\n')
+                    last_byte = block[-1:]
+        else:
+            size = os.path.getsize(file_path)
+            if size == 0:
+                return 0
+
+            # mmap the file and count newlines at memory-bandwidth speed,
+            # windowed so multi-GB files aren't materialized at once
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                window = 1 << 30
+                for offset in range(0, size, window):
+                    count += mm[offset:offset + window].count(b'\n')
+                last_byte = mm[size - 1:size]
+
+        # A trailing partial line (no final newline) still counts
+        if last_byte and last_byte != b'\n':
+            count += 1
 
         return count
 
@@ -224,7 +321,7 @@ def ensure_directory(directory: str):
 
 
 def load_config(config_path: str) -> dict:
-    """Load YAML configuration file
+    """Load YAML configuration file (cached on path and mtime)
 
     Args:
         config_path: Path to configuration file
@@ -233,8 +330,7 @@ def load_config(config_path: str) -> dict:
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml_config(config_path)
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         raise
@@ -249,7 +345,10 @@ def file_exists(file_path: str) -> bool:
     Returns:
         True if file exists, False otherwise
     """
-    return os.path.isfile(file_path)
+    try:
+        return S_ISREG(stat_cached(file_path).st_mode)
+    except OSError:
+        return False
 
 
 def create_backup(file_path: str) -> str:
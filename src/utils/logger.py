@@ -1,11 +1,14 @@
 """
 Centralized logging configuration
 """
+import functools
 import logging
 import os
+import time
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
 from datetime import datetime
-import yaml
+
+from .config_cache import load_yaml_config
 
 
 class Logger:
@@ -20,13 +23,14 @@ class Logger:
         self.config = self._load_config(config_path)
         self.log_config = self.config.get('logging', {})
         self.log_dir = self.config['paths']['logs']
+        # Log file date stamp computed once, not per get_logger call
+        self.log_date = datetime.now().strftime('%Y%m%d')
         self._ensure_log_directory()
 
     def _load_config(self, config_path: str) -> dict:
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file (cached on path and mtime)"""
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml_config(config_path)
         except Exception as e:
             print(f"Error loading config: {e}")
             return {}
@@ -74,7 +78,7 @@ class Logger:
         # File handler with rotation
         log_file = os.path.join(
             self.log_dir,
-            f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
+            f"{name}_{self.log_date}.log"
         )
 
         rotation_type = self.log_config.get('file_rotation', 'daily')
@@ -103,6 +107,9 @@ class Logger:
     def log_execution_time(self, logger: logging.Logger):
         """Decorator to log function execution time
 
+        Delegates to the module-level log_execution_time decorator so the
+        timing logic lives in one place.
+
         Args:
             logger: Logger instance to use
 
@@ -110,29 +117,17 @@ class Logger:
             Decorator function
         """
         def decorator(func):
-            def wrapper(*args, **kwargs):
-                start_time = datetime.now()
-                logger.info(f"Starting {func.__name__}")
-
-                try:
-                    result = func(*args, **kwargs)
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
-                    logger.info(f"Completed {func.__name__} in {duration:.2f} seconds")
-                    return result
-                except Exception as e:
-                    end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
-                    logger.error(f"Error in {func.__name__} after {duration:.2f} seconds: {e}")
-                    raise
-
-            return wrapper
+            return _timed_wrapper(func, logger)
         return decorator
 
 
 # Global logger instance
 _logger_manager = None
 
+# Configured loggers by name - repeat get_logger calls short-circuit here
+# without touching the Logger manager (or re-reading config) at all
+_loggers = {}
+
 
 def get_logger(name: str = None) -> logging.Logger:
     """Get or create global logger instance
@@ -143,32 +138,45 @@ def get_logger(name: str = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    cache_key = name or 'genomic_pipeline'
+    cached = _loggers.get(cache_key)
+    if cached is not None:
+        return cached
+
     global _logger_manager
     if _logger_manager is None:
         _logger_manager = Logger()
 
-    return _logger_manager.get_logger(name)
+    logger = _logger_manager.get_logger(name)
+    _loggers[cache_key] = logger
+    return logger
 
 
-def log_execution_time(func):
-    """Decorator to log function execution time"""
-    logger = get_logger(func.__module__)
+def _timed_wrapper(func, logger: logging.Logger):
+    """Build the timing wrapper shared by both decorator entry points
 
+    Uses time.perf_counter_ns, which is ~10x cheaper than datetime.now()
+    and allocates no objects per call.
+    """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         logger.info(f"Starting {func.__name__}")
 
         try:
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             logger.info(f"Completed {func.__name__} in {duration:.2f} seconds")
             return result
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"Error in {func.__name__} after {duration:.2f} seconds: {e}")
             raise
 
     return wrapper
 
+
+def log_execution_time(func):
+    """Decorator to log function execution time"""
+    return _timed_wrapper(func, get_logger(func.__module__))
+
@@ -4,15 +4,16 @@ Test data quality validation
 import pytest
 import pandas as pd
 import numpy as np
-import os
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.utils import load_config
 
 
+@pytest.fixture(scope='module')
+def af_sample():
+    """Precomputed rare-variant allele frequency sample (deterministic)"""
+    return np.random.default_rng(42).beta(0.5, 10, 1000)
+
+
 class TestDataQuality:
     """Test data quality validation"""
 
@@ -86,20 +87,17 @@ class TestEnrichmentQuality:
         assert associations['gene_symbol'].notna().all()
         assert associations['drug_name'].notna().all()
 
-        # Gene symbols should be uppercase
-        assert (associations['gene_symbol'].str.isupper()).all()
+        # Gene symbols should be uppercase alphanumerics (one C-level
+        # regex pass over the whole column)
+        assert associations['gene_symbol'].str.fullmatch(r'[A-Z0-9]+').all()
 
     def test_drugbank_id_format(self):
         """Test DrugBank ID format"""
-        valid_ids = ['DB00001', 'DB09074', 'DB12345']
+        valid_ids = pd.Series(['DB00001', 'DB09074', 'DB12345'])
 
-        for drug_id in valid_ids:
-            # Should start with DB
-            assert drug_id.startswith('DB')
-
-            # Should have 5 digits after DB
-            assert len(drug_id) == 7
-            assert drug_id[2:].isdigit()
+        # 'DB' prefix followed by exactly 5 digits, validated in one
+        # vectorized pass instead of per-element Python checks
+        assert valid_ids.str.fullmatch(r'DB\d{5}').all()
 
 
 class TestDataConsistency:
@@ -133,14 +131,12 @@ class TestDataConsistency:
 class TestStatisticalValidation:
     """Test statistical properties of data"""
 
-    def test_allele_frequency_distribution(self):
+    def test_allele_frequency_distribution(self, af_sample):
         """Test allele frequency follows expected distribution"""
-        # Rare variants should be more common than common variants
-        af_values = np.random.beta(0.5, 10, 1000)  # Simulates rare variant distribution
-
-        # Most variants should have low frequency
-        low_freq = (af_values < 0.05).sum() / len(af_values)
-        assert low_freq > 0.65  # At least 65% should be rare (adjusted for random variation)
+        # Most variants should have low frequency; the fixture is seeded
+        # so this no longer depends on random variation
+        low_freq = np.count_nonzero(af_sample < 0.05) / len(af_sample)
+        assert low_freq > 0.65  # At least 65% should be rare
 
     def test_variant_count_distribution(self):
         """Test variant counts are reasonable"""
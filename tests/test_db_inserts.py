@@ -3,11 +3,6 @@ Test database insert operations
 """
 import pytest
 import pandas as pd
-import os
-import sys
-
-# Add src to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.etl.load_to_mysql import MySQLLoader
 from src.utils import get_db_config